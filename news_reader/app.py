@@ -5,23 +5,49 @@ Main application controller that coordinates monitoring and CLI tasks
 """
 
 import asyncio
-import aioconsole
 import getpass
-import logging
+import itertools
 import signal
-from typing import Optional, List, Dict, Any
+import sys
 from datetime import datetime
-from telethon import TelegramClient
-from telethon.network.connection import ConnectionTcpFull
-from telethon.errors import SessionPasswordNeededError
-from news_reader.config import Config
-from news_reader.db_client import get_db_client
-from news_reader.monitoring_task import MonitoringTask
-from news_reader.textual_cli_task import TextualCLITask
-from colorama import init, Fore
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, FrozenSet, Set
+from news_reader.config import get_config
+from news_reader.db_client import ChannelRow, get_db_client
 
-# Initialize colorama for colored output
-init(autoreset=True)
+# Telethon is imported where it is used, so importing this module stays cheap
+if TYPE_CHECKING:
+    from telethon import TelegramClient
+    from news_reader.monitoring_task import MonitoringTask
+    from news_reader.textual_cli_task import TextualCLITask
+
+# Colors are only used on a terminal; redirected output (Docker, systemd) gets plain text
+# and skips colorama's stream wrapper, which would otherwise strip codes from every write
+_USE_COLOR = sys.stdout.isatty()
+
+# Color prefixes bound once at import instead of looked up on Fore for every print.
+# colorama itself is only imported when there is a terminal to color.
+if _USE_COLOR:
+    from colorama import Fore, Style
+    _FC, _FY, _FG, _FR = Fore.CYAN, Fore.YELLOW, Fore.GREEN, Fore.RED
+    _RST = Style.RESET_ALL
+else:
+    _FC = _FY = _FG = _FR = _RST = ''
+
+# Fixed console messages, built once
+_MSG_STARTING = f"{_FC}🚀 Starting News Reader Application..."
+_MSG_STARTED = f"{_FG}✅ Application started successfully!"
+_MSG_NO_CACHE = f"{_FY}⚠️ No channel cache found - will fetch on first 'channels' command"
+_MSG_AUTH_REQUIRED = f"{_FY}🔐 Authorization required..."
+_MSG_ENTER_CODE = f"{_FC}Enter the code you received: "
+_MSG_AUTHED = f"{_FG}✅ Successfully authorized!"
+_MSG_2FA = f"{_FC}Enter your 2FA password (input will be hidden): "
+_MSG_AUTHED_2FA = f"{_FG}✅ Successfully authorized with 2FA!"
+_MSG_FETCHING_CHANNELS = f"{_FC}📡 Fetching channels from Telegram API..."
+_MSG_CACHE_FAILED = f"{_FR}❌ Failed to cache channels"
+_MSG_SIGNAL = f"\n{_FY}🛑 Received shutdown signal..."
+_MSG_SHUTTING_DOWN = f"{_FY}🛑 Shutting down application..."
+_MSG_DISCONNECTED = f"{_FY}📱 Disconnected from Telegram"
+_MSG_SHUTDOWN_COMPLETE = f"{_FG}✅ Application shutdown complete"
 
 # Configure logging to write to file instead of console
 from news_reader.logging_config import setup_logging, get_logger
@@ -31,72 +57,87 @@ from news_reader.message_utils import get_current_timestamp
 setup_logging()
 logger = get_logger(__name__)
 
+# Channel info rows buffered between the dialog fetch and the database writer
+CHANNEL_INFO_QUEUE_SIZE = 256
+CHANNEL_INFO_BATCH_SIZE = 64
+
+# How often pending Telegram session changes are committed to disk (seconds)
+SESSION_SAVE_INTERVAL = 60
+
+# Dialogs requested per GetDialogsRequest page (the server does not return more than 100)
+DIALOGS_PAGE_SIZE = 100
+
+# How long cached session data is trusted at startup before get_me() is awaited again (seconds)
+SESSION_DATA_MAX_AGE = 24 * 60 * 60
+
+def _emit(*lines: str) -> None:
+    """Write several banner lines to stdout with a single write and flush"""
+    # Writing to the byte buffer bypasses colorama's autoreset, so reset each line here
+    data = ''.join(f"{line}{_RST}\n" for line in lines)
+    sys.stdout.flush()  # Keep ordering with anything already printed
+    sys.stdout.buffer.write(data.encode(sys.stdout.encoding or 'utf-8', errors='replace'))
+    sys.stdout.buffer.flush()
+
 class NewsReaderApp:
     def __init__(self):
         # Validate configuration
-        self.config = Config()
+        self.config = get_config()
         self.config.validate()
 
         # Initialize Telegram client
-        self.client: TelegramClient = TelegramClient(
-            session=self.config.SESSION_NAME,
-            api_id=self.config.API_ID,
-            api_hash=self.config.API_HASH,
-            connection=ConnectionTcpFull,
-            use_ipv6=False,
-            proxy=None,
-            local_addr=None,
-            timeout=10,
-            request_retries=5,
-            connection_retries=5,
-            retry_delay=1,
-            auto_reconnect=True,
-            sequential_updates=False,
-            flood_sleep_threshold=60,
-            device_model='News Reader App',
-            system_version='2.0.0',
-            app_version='2.0.0',
-            lang_code='en',
-            system_lang_code='en'
-        )
+        from news_reader.client_factory import get_client
+        self.client: 'TelegramClient' = get_client(self.config)
 
         # Initialize rest of the application
         self.db_client = get_db_client()
         self.running = False
         self.monitoring_task: Optional[asyncio.Task] = None
         self.cli_task: Optional[asyncio.Task] = None
-        self.monitoring_task_instance: Optional[MonitoringTask] = None
-        self.cli_task_instance: Optional[TextualCLITask] = None
-        self.monitored_channels: List[int] = []
+        self.session_save_task: Optional[asyncio.Task] = None
+        self.monitoring_task_instance: Optional['MonitoringTask'] = None
+        self.cli_task_instance: Optional['TextualCLITask'] = None
+        self.monitored_channels: FrozenSet[int] = frozenset()  # For membership checks
+        self.monitored_channels_list: List[int] = []  # Same channels in database order, for display
         self.session_data: Dict[str, Any] = {}
+        self._background_tasks: Set[asyncio.Task] = set()  # Fire-and-forget work awaited at shutdown, see _track_background_task
         self.cached_channels: List[Dict[str, Any]] = []
+        self.cached_channels_by_id: Dict[int, Dict[str, Any]] = {}  # Same channels keyed by ID, see _set_cached_channels
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None  # Created in run() once the loop exists
         
     async def startup(self):
         """Initialize the application and perform user login"""
-        print(f"{Fore.CYAN}🚀 Starting News Reader Application...")
+        # Initialize colorama for colored output
+        if _USE_COLOR:
+            from colorama import init
+            init(autoreset=True)
+        
+        print(_MSG_STARTING)
         
         # Initialize Telegram client
         if not await self._initialize_client():
             return False
             
-        # Load user session data into memory
-        await self._load_session_data()
-        
-        # Load monitored channels configuration
-        await self._load_monitored_channels()
-        
-        # Load cached channels or fetch them if not cached
-        await self._load_cached_channels()
-        
-        print(f"{Fore.GREEN}✅ Application started successfully!")
-        print(f"{Fore.YELLOW}📱 User: {self.session_data.get('user_name', 'Unknown')}")
-        print(f"{Fore.YELLOW}📺 Monitoring {len(self.monitored_channels)} channels")
+        # Load user session data, monitored channels configuration and cached channels.
+        # These are independent once the client is connected, so run them concurrently.
+        await asyncio.gather(
+            self._load_session_data(),
+            self._load_monitored_channels(),
+            self._load_cached_channels()
+        )
         
         cache_info = self.db_client.get_cache_info()
         if cache_info.get('has_cache'):
-            print(f"{Fore.CYAN}💾 Cached {cache_info.get('channels_count', 0)} channels (last updated: {cache_info.get('cached_at', 'Unknown')})")
+            cache_line = f"{_FC}💾 Cached {cache_info.get('channels_count', 0)} channels (last updated: {cache_info.get('cached_at', 'Unknown')})"
         else:
-            print(f"{Fore.YELLOW}⚠️ No channel cache found - will fetch on first 'channels' command")
+            cache_line = _MSG_NO_CACHE
+        
+        _emit(
+            _MSG_STARTED,
+            f"{_FY}📱 User: {self.session_data.get('user_name', 'Unknown')}",
+            f"{_FY}📺 Monitoring {len(self.monitored_channels)} channels",
+            cache_line
+        )
         
         return True
     
@@ -111,44 +152,65 @@ class NewsReaderApp:
                 await self._authorize_user()
             
             logger.info("✅ Successfully connected to Telegram!")
+            
+            # Persist the session right away so a fresh login survives a crash
+            await self._save_session()
             return True
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize client: {e}")
-            print(f"{Fore.RED}❌ Failed to initialize client: {e}")
+            logger.error("❌ Failed to initialize client: %s", e)
+            print(f"{_FR}❌ Failed to initialize client: {e}")
             return False
     
     async def _authorize_user(self):
         """Handle user authorization"""
+        from telethon.errors import SessionPasswordNeededError
+        
         try:
-            print(f"{Fore.YELLOW}🔐 Authorization required...")
+            print(_MSG_AUTH_REQUIRED)
             
             # Send code request
             ret = await self.client.send_code_request(self.config.PHONE_NUMBER)
             print(ret)
-            print(f"{Fore.YELLOW}📱 Code sent to {self.config.PHONE_NUMBER}")
+            print(f"{_FY}📱 Code sent to {self.config.PHONE_NUMBER}")
             
             # Get code from user
-            code = await aioconsole.ainput(f"{Fore.CYAN}Enter the code you received: ")
+            code = await asyncio.to_thread(input, _MSG_ENTER_CODE)
             
             try:
                 # Sign in with the code
                 await self.client.sign_in(self.config.PHONE_NUMBER, code)
-                print(f"{Fore.GREEN}✅ Successfully authorized!")
+                print(_MSG_AUTHED)
                 
             except SessionPasswordNeededError as e:
                 # Handle 2FA - use getpass for secure password input
-                print(f"{Fore.CYAN}Enter your 2FA password (input will be hidden): ", end="", flush=True)
-                password = getpass.getpass("")
+                print(_MSG_2FA, end="", flush=True)
+                password = await asyncio.to_thread(getpass.getpass, "")
                 await self.client.sign_in(password=password)
-                print(f"{Fore.GREEN}✅ Successfully authorized with 2FA!")
+                print(_MSG_AUTHED_2FA)
                     
         except Exception as e:
-            logger.error(f"❌ Authorization failed: {e}")
+            logger.error("❌ Authorization failed: %s", e)
             raise
     
     async def _load_session_data(self):
         """Load user session data into memory"""
+        try:
+            # Serve a recent copy from the database and revalidate it in the background
+            cached = await asyncio.to_thread(self.db_client.get_session_data)
+            if cached.get('session_data') and self._is_session_data_fresh(cached.get('saved_at')):
+                self.session_data = cached['session_data']
+                self._track_background_task(asyncio.create_task(self._refresh_session_data()))
+                logger.info("Loaded cached session data for user: %s", self.session_data.get('user_name', 'Unknown'))
+                return
+        except Exception as e:
+            logger.error("Failed to load cached session data: %s", e)
+        
+        await self._refresh_session_data()
+    
+    async def _refresh_session_data(self):
+        """Fetch user session data from Telegram and save it to the database"""
+        login_time = get_current_timestamp()
         try:
             if self.client:
                 me = await self.client.get_me()
@@ -157,30 +219,48 @@ class NewsReaderApp:
                     'user_name': f"{me.first_name} {me.last_name or ''}".strip(),
                     'username': me.username,
                     'phone': me.phone,
-                    'login_time': get_current_timestamp()
+                    'login_time': login_time
                 }
-                logger.info(f"Loaded session data for user: {self.session_data['user_name']}")
+                logger.info("Loaded session data for user: %s", self.session_data['user_name'])
+                await asyncio.to_thread(self.db_client.save_session_data, self.session_data)
         except Exception as e:
-            logger.error(f"Failed to load session data: {e}")
-            self.session_data = {'user_name': 'Unknown', 'login_time': get_current_timestamp()}
+            logger.error("Failed to load session data: %s", e)
+            if not self.session_data:
+                self.session_data = {'user_name': 'Unknown', 'login_time': login_time}
+    
+    @staticmethod
+    def _is_session_data_fresh(saved_at: Optional[str]) -> bool:
+        """Check whether cached session data is recent enough to skip get_me() at startup"""
+        try:
+            age = datetime.now() - datetime.fromisoformat(saved_at)
+            return age.total_seconds() < SESSION_DATA_MAX_AGE
+        except (TypeError, ValueError):
+            return False
     
     async def _load_monitored_channels(self):
         """Load monitored channels from database"""
         try:
-            self.monitored_channels = self.db_client.get_monitored_channels()
-            logger.info(f"Loaded {len(self.monitored_channels)} monitored channels")
+            self.monitored_channels_list = await asyncio.to_thread(self.db_client.get_monitored_channels)
+            self.monitored_channels = frozenset(self.monitored_channels_list)
+            logger.info("Loaded %s monitored channels", len(self.monitored_channels))
         except Exception as e:
-            logger.error(f"Failed to load monitored channels: {e}")
-            self.monitored_channels = []
+            logger.error("Failed to load monitored channels: %s", e)
+            self.monitored_channels_list = []
+            self.monitored_channels = frozenset()
     
     async def _load_cached_channels(self):
         """Load cached channels from database"""
         try:
-            self.cached_channels = self.db_client.get_cached_channels()
-            logger.info(f"Loaded {len(self.cached_channels)} cached channels")
+            self._set_cached_channels(await asyncio.to_thread(self.db_client.get_cached_channels))
+            logger.info("Loaded %s cached channels", len(self.cached_channels))
         except Exception as e:
-            logger.error(f"Failed to load cached channels: {e}")
-            self.cached_channels = []
+            logger.error("Failed to load cached channels: %s", e)
+            self._set_cached_channels([])
+    
+    def _set_cached_channels(self, channels: List[Dict[str, Any]]):
+        """Replace the cached channels list and the ID lookup derived from it"""
+        self.cached_channels = channels
+        self.cached_channels_by_id = {channel['id']: channel for channel in channels}
     
     async def refresh_channels_cache(self, user: str = 'system') -> bool:
         """Refresh channels cache by fetching from Telegram API"""
@@ -189,111 +269,266 @@ class NewsReaderApp:
                 logger.error("Client not initialized")
                 return False
             
-            print(f"{Fore.CYAN}📡 Fetching channels from Telegram API...")
+            print(_MSG_FETCHING_CHANNELS)
             channels = []
             
-            async for dialog in self.client.iter_dialogs():
-                if dialog.is_channel:
-                    channel_data = {
-                        'id': dialog.id,
-                        'title': dialog.title,
-                        'username': getattr(dialog.entity, 'username', None)
-                    }
-                    channels.append(channel_data)
-                    
-                    # Also save individual channel info
-                    self.db_client.add_channel_info(
-                        channel_id=dialog.id,
-                        channel_title=dialog.title,
-                        channel_username=getattr(dialog.entity, 'username', None)
-                    )
+            # Persist channel info in the background while dialogs are still being fetched
+            channel_info_queue: asyncio.Queue = asyncio.Queue(maxsize=CHANNEL_INFO_QUEUE_SIZE)
+            consumer = asyncio.create_task(self._drain_channel_infos(channel_info_queue))
+            
+            try:
+                async for channel_id, channel in self._iter_channel_dialogs():
+                    username = getattr(channel, 'username', None)
+                    channels.append({
+                        'id': channel_id,
+                        'title': channel.title,
+                        'username': username
+                    })
+                    await channel_info_queue.put(ChannelRow(channel_id, channel.title, username))
+                
+                # Signal the end of the dialogs; the last batches are written in the background
+                await channel_info_queue.put(None)
+            except BaseException:
+                consumer.cancel()
+                raise
+            self._track_background_task(consumer)
             
             # Cache the channels list
-            if self.db_client.cache_channels_list(channels, user):
-                self.cached_channels = channels
-                print(f"{Fore.GREEN}✅ Successfully cached {len(channels)} channels")
-                logger.info(f"Refreshed channels cache with {len(channels)} channels")
+            if await asyncio.to_thread(self.db_client.cache_channels_list, channels, user):
+                self._set_cached_channels(channels)
+                print(f"{_FG}✅ Successfully cached {len(channels)} channels")
+                logger.info("Refreshed channels cache with %s channels", len(channels))
                 return True
             else:
-                print(f"{Fore.RED}❌ Failed to cache channels")
+                print(_MSG_CACHE_FAILED)
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to refresh channels cache: {e}")
-            print(f"{Fore.RED}❌ Failed to refresh channels cache: {e}")
+            logger.error("Failed to refresh channels cache: %s", e)
+            print(f"{_FR}❌ Failed to refresh channels cache: {e}")
             return False
     
+    async def _iter_channel_dialogs(self):
+        """Yield (channel_id, channel) for every channel dialog using raw GetDialogsRequest pages"""
+        from telethon import utils
+        from telethon.tl.functions.messages import GetDialogsRequest
+        from telethon.tl.types import Channel, ChatEmpty, InputPeerEmpty, UserEmpty
+        from telethon.tl.types.messages import DialogsNotModified, DialogsSlice
+        
+        def request_page(offset_date, offset_id, offset_peer, exclude_pinned) -> asyncio.Task:
+            return asyncio.create_task(self.client(GetDialogsRequest(
+                offset_date=offset_date,
+                offset_id=offset_id,
+                offset_peer=offset_peer,
+                limit=DIALOGS_PAGE_SIZE,
+                hash=0,
+                exclude_pinned=exclude_pinned
+            )))
+        
+        # Each page is requested at the server's maximum size and read straight from the raw
+        # result, without building a Dialog and Message wrapper for every chat like iter_dialogs.
+        # Paging follows Telethon's _DialogsIter. Pages are chained by offset, so they cannot be
+        # fetched in parallel, but the next one is requested before this page's channels are
+        # handed to the caller.
+        pending: Optional[asyncio.Task] = request_page(None, 0, InputPeerEmpty(), False)
+        offset_date = None
+        seen = set()
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                if isinstance(result, DialogsNotModified) or not result.dialogs:
+                    return
+                
+                entities = {
+                    utils.get_peer_id(entity): entity
+                    for entity in itertools.chain(result.users, result.chats)
+                    if not isinstance(entity, (UserEmpty, ChatEmpty))
+                }
+                messages = {
+                    (utils.get_peer_id(message.peer_id), message.id): message
+                    for message in result.messages if getattr(message, 'peer_id', None)
+                }
+                
+                new_dialogs = []
+                for dialog in result.dialogs:
+                    peer = getattr(dialog, 'peer', None)
+                    if peer is None:
+                        continue
+                    peer_id = utils.get_peer_id(peer)
+                    
+                    # Telegram may ignore the offset date, so skip dialogs past it
+                    if offset_date is not None:
+                        date = getattr(messages.get((peer_id, dialog.top_message)), 'date', None)
+                        if not date or date > offset_date:
+                            continue
+                    
+                    if peer_id not in seen:
+                        seen.add(peer_id)
+                        if peer_id in entities:
+                            new_dialogs.append((peer_id, entities[peer_id]))
+                
+                # Stop when a page adds no unseen dialog (the offset did not move forward),
+                # on a short page, or on a full Dialogs result, which has nothing after it
+                if new_dialogs and isinstance(result, DialogsSlice) and len(result.dialogs) >= DIALOGS_PAGE_SIZE:
+                    # Pinned dialogs are out of date order, so continue from the last dialog
+                    # that has a message, and leave pinned dialogs out of the following pages
+                    last_message = next(filter(None, (
+                        messages.get((utils.get_peer_id(dialog.peer), dialog.top_message))
+                        for dialog in reversed(result.dialogs) if getattr(dialog, 'peer', None)
+                    )), None)
+                    offset_date = getattr(last_message, 'date', None)
+                    pending = request_page(
+                        offset_date,
+                        last_message.id if last_message else 0,
+                        utils.get_input_peer(new_dialogs[-1][1]),
+                        True
+                    )
+                
+                for peer_id, entity in new_dialogs:
+                    if isinstance(entity, Channel):
+                        yield peer_id, entity
+        finally:
+            # The caller stopped early or failed, so drop the prefetched page
+            if pending is not None:
+                pending.cancel()
+    
+    async def _drain_channel_infos(self, queue: asyncio.Queue) -> None:
+        """Write channel info rows from the queue in batches until a None sentinel arrives"""
+        finished = False
+        while not finished:
+            batch = []
+            while len(batch) < CHANNEL_INFO_BATCH_SIZE:
+                row = await queue.get()
+                if row is None:
+                    finished = True
+                    break
+                batch.append(row)
+            
+            if batch:
+                await asyncio.to_thread(self.db_client.add_channel_info_bulk, batch)
+    
+    def _track_background_task(self, task: asyncio.Task) -> None:
+        """Keep a reference to a fire-and-forget task until it finishes and log its failure"""
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+    
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        """Drop a finished background task and log its exception, if any"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background task failed: %s", task.exception())
+    
     async def run(self):
         """Main application loop"""
         if not await self.startup():
             return
         
+        # Import the UI and monitoring stacks (Textual, OpenAI) only once startup succeeded
+        from news_reader.monitoring_task import MonitoringTask
+        from news_reader.textual_cli_task import TextualCLITask
+        
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
         
         # Create task instances
         self.cli_task_instance = TextualCLITask(self)
         self.monitoring_task_instance = MonitoringTask(self.client, self.monitored_channels)
         
-        # Start background tasks
-        self.monitoring_task = asyncio.create_task(self.monitoring_task_instance.start())
-        self.cli_task = asyncio.create_task(self.cli_task_instance.start())
+        # Let tasks that finish without suspending (filtered updates, cache hits) run inline.
+        # Telethon's own create_task calls pick this up too. Requires Python 3.12+.
+        if hasattr(asyncio, 'eager_task_factory'):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
         
         # Setup signal handlers for graceful shutdown
         for sig in [signal.SIGINT, signal.SIGTERM]:
-            signal.signal(sig, self._signal_handler)
+            if sys.platform == 'win32':
+                # add_signal_handler is POSIX-only
+                signal.signal(sig, self._signal_handler)
+            else:
+                self._loop.add_signal_handler(sig, self._on_signal)
         
         try:
-            # Wait for tasks to complete or for shutdown signal
-            while self.running:
-                # Check if CLI task has finished
-                if self.cli_task.done():
-                    break
-                await asyncio.sleep(0.1)
-            
-            # If we're here, either running=False or CLI task finished
-            if not self.running:
+            # The task group cancels the remaining tasks if one of them fails,
+            # and does not exit until all of them are finished
+            async with asyncio.TaskGroup() as tg:
+                self.monitoring_task = tg.create_task(self.monitoring_task_instance.start())
+                self.cli_task = tg.create_task(self.cli_task_instance.start())
+                self.session_save_task = tg.create_task(self._save_session_periodically())
+                
+                # Sleep until the CLI task finishes or a shutdown signal arrives
+                self.cli_task.add_done_callback(lambda _: self._stop_event.set())
+                await self._stop_event.wait()
+                
                 logger.info("Shutdown requested, stopping tasks...")
-        except Exception as e:
-            logger.error(f"Error in main loop: {e}")
+                for task in (self.monitoring_task, self.session_save_task):
+                    task.cancel()
+                # The CLI task ends through App.exit(); cancel it only if Textual never started
+                self.cli_task_instance.stop()
+                if not self.cli_task_instance.textual_app:
+                    self.cli_task.cancel()
+        except* Exception as eg:
+            for e in eg.exceptions:
+                logger.error("Error in main loop: %s", e)
         finally:
             await self.shutdown()
     
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals"""
-        print(f"\n{Fore.YELLOW}🛑 Received shutdown signal...")
+    async def _save_session(self):
+        """Commit pending Telegram session changes to disk"""
+        from news_reader.client_factory import save_session
+        await asyncio.to_thread(save_session, self.client)
+    
+    async def _save_session_periodically(self):
+        """Write the session and database changes to disk at a fixed interval to bound what a crash loses"""
+        while self.running:
+            await asyncio.sleep(SESSION_SAVE_INTERVAL)
+            await self._save_session()
+            await asyncio.to_thread(self.db_client.flush)
+    
+    def _on_signal(self):
+        """Handle shutdown signals from within the event loop"""
+        print(_MSG_SIGNAL)
         self.running = False
+        
+        # Let Textual exit on its own so it restores the terminal, and cancel monitoring right away
+        if self.cli_task_instance:
+            self.cli_task_instance.stop()
+        if self.monitoring_task and not self.monitoring_task.done():
+            self.monitoring_task.cancel()
+        if self._stop_event:
+            self._stop_event.set()
+    
+    def _signal_handler(self, signum, frame):
+        """Handle shutdown signals on platforms without loop.add_signal_handler"""
+        # Signal handlers run outside the event loop, so hand over to it safely
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._on_signal)
     
     async def shutdown(self):
         """Graceful shutdown"""
-        print(f"{Fore.YELLOW}🛑 Shutting down application...")
+        print(_MSG_SHUTTING_DOWN)
         
         self.running = False
         
         # Stop task instances
         if self.monitoring_task_instance:
             self.monitoring_task_instance.stop()
+            # Let in-flight batches finish and reach the database before disconnecting
+            await self.monitoring_task_instance.wait_for_batches()
         
         if self.cli_task_instance:
             self.cli_task_instance.stop()
         
-        # Cancel tasks
-        if self.monitoring_task and not self.monitoring_task.done():
-            self.monitoring_task.cancel()
-            try:
-                await self.monitoring_task
-            except asyncio.CancelledError:
-                pass
-        
-        if self.cli_task and not self.cli_task.done():
-            self.cli_task.cancel()
-            try:
-                await self.cli_task
-            except asyncio.CancelledError:
-                pass
+        # Let pending background work (database writes, session data refresh) finish, then write it to disk
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await asyncio.to_thread(self.db_client.flush)
         
-        # Disconnect client
+        # Save the session and disconnect client
         if self.client:
+            await self._save_session()
             await self.client.disconnect()
-            print(f"{Fore.YELLOW}📱 Disconnected from Telegram")
+            print(_MSG_DISCONNECTED)
         
-        print(f"{Fore.GREEN}✅ Application shutdown complete")
+        print(_MSG_SHUTDOWN_COMPLETE)
@@ -4,27 +4,75 @@ Channel Sender Service - Handles sending messages to Telegram channels
 """
 
 import asyncio
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, List, Optional, Set, Tuple
 from telethon import TelegramClient
 from telethon.errors import ChannelPrivateError, ChatWriteForbiddenError, FloodWaitError
 from news_reader.logging_config import get_logger
-from news_reader.config import Config
+from news_reader.config import get_config
 from news_reader.message_utils import extract_message_metadata
+from telethon.tl.types import TypeInputPeer
 from telethon.utils import get_peer_id
 
 logger = get_logger(__name__)
 
+# Outgoing messages waiting for the sender task, and how many are combined into one post
+OUTGOING_QUEUE_SIZE = 512
+OUTGOING_BATCH_SIZE = 16
+
+# Posts sent to SINK_CHANNEL at the same time over the client's connection
+SEND_CONCURRENCY = 8
+
+# Telegram's limit for a single text message in UTF-16 code units, and the separator between combined messages
+MAX_MESSAGE_LENGTH = 4096
+BATCH_SEPARATOR = "\n\n"
+
+def _utf16_length(text: str) -> int:
+    """Length of text as Telegram counts it, where characters outside the BMP (e.g. emoji) take two units"""
+    return len(text.encode('utf-16-le')) // 2
+
+@lru_cache(maxsize=1024)
+def _source_header(chat_name: str, separator: str = '') -> str:
+    """Build the source header for a chat, cached since messages come from a few chats"""
+    return f"**Source:** {chat_name}{separator}\n\n"
+
 class ChannelSender:
     """Service for sending messages to Telegram channels"""
     
     def __init__(self, client: TelegramClient):
         """Initialize channel sender with Telegram client"""
         self.client = client
-        self.sink_channel = Config.SINK_CHANNEL
+        self.sink_channel = get_config().SINK_CHANNEL
+        self._enabled = bool(self.sink_channel)  # Fixed for the lifetime of the instance
+        self._sink_entity: Optional[TypeInputPeer] = None  # Resolved lazily, see _get_sink_entity
+        self._out_q: asyncio.Queue = asyncio.Queue(maxsize=OUTGOING_QUEUE_SIZE)
+        self._drainer: Optional[asyncio.Task] = None  # Started on the first queued message
+        self._inflight = asyncio.Semaphore(SEND_CONCURRENCY)
+        self._send_tasks: Set[asyncio.Task] = set()
+        self._connected = False  # Cached client.is_connected(), cleared when a send fails
         
     def is_configured(self) -> bool:
         """Check if SINK_CHANNEL is configured"""
-        return True
+        return self._enabled
+    
+    def _is_connected(self) -> bool:
+        """Check the client connection, asking the client only until it is known to be connected"""
+        if not self._connected:
+            self._connected = bool(self.client and self.client.is_connected())
+        return self._connected
+    
+    async def _get_sink_entity(self) -> TypeInputPeer:
+        """Get the input peer for SINK_CHANNEL, resolving it only once"""
+        if self._sink_entity is None:
+            try:
+                self._sink_entity = await self.client.get_input_entity(self.sink_channel)
+            except ValueError:
+                # The channel is not in the session's entity cache yet (e.g. a new SESSION_STRING
+                # login). Loading the dialogs caches every joined chat, then resolve it again.
+                logger.info("SINK_CHANNEL (%s) not cached, loading dialogs to resolve it", self.sink_channel)
+                await self.client.get_dialogs()
+                self._sink_entity = await self.client.get_input_entity(self.sink_channel)
+        return self._sink_entity
     
     async def _send_to_sink_channel(self, message: str, operation_name: str) -> bool:
         """
@@ -38,22 +86,118 @@ class ChannelSender:
             True if message was sent successfully, False otherwise
         """
         try:
-            await self.client.send_message(self.sink_channel, message)
-            logger.info(f"Successfully {operation_name} to SINK_CHANNEL ({self.sink_channel})")
+            try:
+                await self.client.send_message(await self._get_sink_entity(), message)
+            except (ChannelPrivateError, ValueError):
+                # The cached peer may be stale, so resolve it again and retry once
+                self._sink_entity = None
+                await self.client.send_message(await self._get_sink_entity(), message)
+            logger.info("Successfully %s to SINK_CHANNEL (%s)", operation_name, self.sink_channel)
             return True
             
         except ChannelPrivateError:
-            logger.error(f"Cannot {operation_name} to SINK_CHANNEL ({self.sink_channel}): Channel is private or bot is not a member")
+            logger.error("Cannot %s to SINK_CHANNEL (%s): Channel is private or bot is not a member", operation_name, self.sink_channel)
             return False
         except ChatWriteForbiddenError:
-            logger.error(f"Cannot {operation_name} to SINK_CHANNEL ({self.sink_channel}): No permission to write to this channel")
+            logger.error("Cannot %s to SINK_CHANNEL (%s): No permission to write to this channel", operation_name, self.sink_channel)
             return False
         except FloodWaitError as e:
-            logger.warning(f"Rate limited when {operation_name} to SINK_CHANNEL: must wait {e.seconds} seconds")
+            logger.warning("Rate limited when %s to SINK_CHANNEL: must wait %s seconds", operation_name, e.seconds)
             return False
         except Exception as e:
-            logger.error(f"Failed to {operation_name} to SINK_CHANNEL ({self.sink_channel}): {e}")
+            logger.error("Failed to %s to SINK_CHANNEL (%s): %s", operation_name, self.sink_channel, e)
+            self._connected = False  # The connection may be gone, check it again next time
+            return False
+    
+    async def _enqueue(self, message: str, operation_name: str) -> bool:
+        """Queue a message for the sender task and wait until it has been sent"""
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain_loop())
+        
+        sent = asyncio.get_running_loop().create_future()
+        await self._out_q.put((message, operation_name, sent))
+        return await sent
+    
+    async def _drain_loop(self) -> None:
+        """Send queued messages, combining the ones that are waiting into as few posts as possible"""
+        while True:
+            batch = [await self._out_q.get()]
+            while len(batch) < OUTGOING_BATCH_SIZE and not self._out_q.empty():
+                batch.append(self._out_q.get_nowait())
+            
+            for group in self._group_batch(batch):
+                # Wait for a free slot, so the queue still applies backpressure to producers
+                await self._inflight.acquire()
+                task = asyncio.create_task(self._send_group(group))
+                self._send_tasks.add(task)
+                task.add_done_callback(self._send_tasks.discard)
+    
+    async def _send_group(self, group: List[Tuple[str, str, asyncio.Future]]) -> None:
+        """Send a group of queued messages as one post and report the result to each caller"""
+        try:
+            if len(group) == 1:
+                message, operation_name, _ = group[0]
+            else:
+                message = BATCH_SEPARATOR.join(item[0] for item in group)
+                operation_name = f"sent {len(group)} combined messages"
+            
+            try:
+                result = await self._send_to_sink_channel(message, operation_name)
+            except Exception as e:
+                logger.error("Failed to send queued messages: %s", e)
+                result = False
+            
+            for _, _, sent in group:
+                if not sent.done():
+                    sent.set_result(result)
+        finally:
+            self._inflight.release()
+    
+    @staticmethod
+    def _group_batch(batch: List[Tuple[str, str, asyncio.Future]]) -> List[List[Tuple[str, str, asyncio.Future]]]:
+        """Split queued messages into consecutive groups that fit in one Telegram message"""
+        groups = []
+        current = []
+        current_length = 0
+        for item in batch:
+            added_length = _utf16_length(item[0]) + (_utf16_length(BATCH_SEPARATOR) if current else 0)
+            if current and current_length + added_length > MAX_MESSAGE_LENGTH:
+                groups.append(current)
+                current = []
+                current_length = 0
+                added_length = _utf16_length(item[0])
+            current.append(item)
+            current_length += added_length
+        if current:
+            groups.append(current)
+        return groups
+    
+    async def _do_send(self, kind: str, format_message: Callable[[str, dict], str], text: str, original_message_data: dict) -> bool:
+        """
+        Common path for all outgoing messages: check that sending is possible, then format and queue
+        
+        Args:
+            kind: Description of the message for logging
+            format_message: Formatter turning the text and original message data into the post
+            text: The summary or original message text
+            original_message_data: Original message metadata
+        
+        Returns:
+            True if message was sent successfully, False otherwise
+        """
+        if not self._enabled:
+            logger.warning("SINK_CHANNEL not configured - skipping %s", kind)
+            return False
+        
+        if not self._is_connected():
+            logger.error("Telegram client not connected - cannot send %s", kind)
             return False
+        
+        # Formatting happens only once the message can actually be sent
+        formatted_message = format_message(text, original_message_data)
+        
+        # Queue for the sender task, which uses the consolidated error handling
+        return await self._enqueue(formatted_message, f"sent {kind}")
     
     async def send_summary_to_sink_channel(self, summary: str, original_message_data: dict) -> bool:
         """
@@ -70,19 +214,7 @@ class ChannelSender:
         Returns:
             True if message was sent successfully, False otherwise
         """
-        if not self.is_configured():
-            logger.warning("SINK_CHANNEL not configured - skipping summary sending")
-            return False
-        
-        if not self.client or not self.client.is_connected():
-            logger.error("Telegram client not connected - cannot send summary")
-            return False
-        
-        # Format the summary message
-        formatted_message = self._format_summary_message(summary, original_message_data)
-        
-        # Send using consolidated error handling
-        return await self._send_to_sink_channel(formatted_message, "sent summary")
+        return await self._do_send("summary", self._format_summary_message, summary, original_message_data)
     
     async def forward_message_to_sink_channel(self, message_text: str, original_message_data: dict) -> bool:
         """
@@ -95,19 +227,7 @@ class ChannelSender:
         Returns:
             True if message was sent successfully, False otherwise
         """
-        if not self.is_configured():
-            logger.warning("SINK_CHANNEL not configured - skipping message forwarding")
-            return False
-        
-        if not self.client or not self.client.is_connected():
-            logger.error("Telegram client not connected - cannot forward message")
-            return False
-        
-        # Format the forwarded message
-        formatted_message = self._format_forwarded_message(message_text, original_message_data)
-        
-        # Send using consolidated error handling
-        return await self._send_to_sink_channel(formatted_message, "forwarded message")
+        return await self._do_send("forwarded message", self._format_forwarded_message, message_text, original_message_data)
     
     def _format_summary_message(self, summary: str, original_message_data: dict) -> str:
         """
@@ -123,7 +243,9 @@ class ChannelSender:
         metadata = extract_message_metadata(original_message_data)
         
         # Create a formatted summary message
-        formatted_message = f"**Source:** {metadata['chat_name']} \n\n{summary} \n\n [Original Message]({metadata['message_link']})"
+        formatted_message = "".join((
+            _source_header(metadata['chat_name'], ' '), summary, " \n\n [Original Message](", metadata['message_link'], ")"
+        ))
 
         return formatted_message
     
@@ -141,7 +263,9 @@ class ChannelSender:
         metadata = extract_message_metadata(original_message_data)
         
         # Create a formatted forwarded message
-        formatted_message = f"**Source:** {metadata['chat_name']}\n\n{message_text}\n\n[Original Message]({metadata['message_link']})"
+        formatted_message = "".join((
+            _source_header(metadata['chat_name']), message_text, "\n\n[Original Message](", metadata['message_link'], ")"
+        ))
 
         return formatted_message
     
@@ -152,28 +276,29 @@ class ChannelSender:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if not self.is_configured():
+        if not self._enabled:
             return False, "SINK_CHANNEL not configured"
         
-        if not self.client.is_connected():
+        if not self._is_connected():
             return False, "Telegram client not connected"
         
         try:
-            # Try to get channel info
-            # Convert sink_channel to proper TelegramPeer id
-            entity = await self.client.get_entity(int(self.sink_channel))
+            # Resolve the channel peer again, loading the dialogs if it is not cached yet
+            self._sink_entity = None
+            entity = await self._get_sink_entity()
             
             # Try to send a test message
             test_message = "🔧 Test message from News Reader Bot - SINK_CHANNEL is working!"
             await self.client.send_message(entity, test_message)
             
-            return True, f"Successfully tested SINK_CHANNEL access: {getattr(entity, 'title', self.sink_channel)}"
+            return True, f"Successfully tested SINK_CHANNEL access: {self.sink_channel}"
             
         except ChannelPrivateError:
             return False, f"SINK_CHANNEL ({self.sink_channel}) is private or bot is not a member"
         except ChatWriteForbiddenError:
             return False, f"No permission to write to SINK_CHANNEL ({self.sink_channel})"
         except Exception as e:
+            self._connected = False
             return False, f"Failed to access SINK_CHANNEL ({self.sink_channel}): {e}"
 
 
@@ -184,7 +309,8 @@ def get_channel_sender(client: Optional[TelegramClient] = None) -> Optional[Chan
     """Get the global ChannelSender instance"""
     global _channel_sender_instance
     
-    if client and (_channel_sender_instance is None or _channel_sender_instance.client != client):
+    # The process has a single Telegram client (see client_factory), so create the sender once
+    if _channel_sender_instance is None and client is not None:
         _channel_sender_instance = ChannelSender(client)
     
     return _channel_sender_instance
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Client Factory - Builds the process-wide Telegram client
+"""
+
+import os
+from typing import Optional
+from telethon import TelegramClient
+from telethon.network.connection import ConnectionTcpFull
+from telethon.sessions import MemorySession, Session, SQLiteSession, StringSession
+from news_reader.config import Config
+from news_reader.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Connection and device settings shared by every client built here
+TG_CLIENT_KWARGS = dict(
+    connection=ConnectionTcpFull,
+    use_ipv6=False,
+    proxy=None,
+    local_addr=None,
+    timeout=10,
+    request_retries=5,
+    connection_retries=5,
+    retry_delay=1,
+    auto_reconnect=True,
+    sequential_updates=True,  # Handlers only buffer messages, see MonitoringTask
+    flood_sleep_threshold=60,
+    device_model='News Reader App',
+    system_version='2.0.0',
+    app_version='2.0.0',
+    lang_code='en',
+    system_lang_code='en'
+)
+
+# Session strings written by earlier versions next to SESSION_NAME, imported into the SQLite session
+SESSION_STRING_SUFFIX = '.session.str'
+
+class BufferedSQLiteSession(SQLiteSession):
+    """SQLite session that commits only on flush() or close(), instead of on every save()"""
+    
+    def save(self):
+        """Skip the commit Telethon requests after each auth, update state and entity change"""
+        # Changes stay in the open transaction; save_session() and close() commit them
+    
+    def flush(self):
+        """Commit pending session changes to the session file"""
+        super().save()
+
+# Global instance
+_client: Optional[TelegramClient] = None
+
+def get_client(config: Config) -> TelegramClient:
+    """Get or create the Telegram client, so the session is only loaded once per process"""
+    global _client
+    if _client is None:
+        _client = TelegramClient(
+            session=_load_session(config),
+            api_id=config.API_ID,
+            api_hash=config.API_HASH,
+            **TG_CLIENT_KWARGS
+        )
+        logger.info(f"Created Telegram client for session: {config.SESSION_NAME}")
+    return _client
+
+def _load_session(config: Config) -> Session:
+    """Load the session from SESSION_STRING, or the persistent SQLite session named by SESSION_NAME"""
+    if config.SESSION_STRING:
+        return StringSession(config.SESSION_STRING.strip())
+    if not config.SESSION_NAME:
+        return MemorySession()
+    
+    # The SQLite session also keeps Telethon's entity cache, so peers such as SINK_CHANNEL
+    # can still be resolved by ID after a restart
+    session = BufferedSQLiteSession(config.SESSION_NAME)
+    _import_session_string(session, config.SESSION_NAME + SESSION_STRING_SUFFIX)
+    return session
+
+def _import_session_string(session: BufferedSQLiteSession, path: str) -> None:
+    """Move a login saved as a session string file by an earlier version into the SQLite session"""
+    if session.auth_key is not None or not os.path.exists(path):
+        return
+    
+    try:
+        with open(path, 'r') as f:
+            string_session = StringSession(f.read().strip())
+        if string_session.auth_key is not None:
+            session.set_dc(string_session.dc_id, string_session.server_address, string_session.port)
+            session.auth_key = string_session.auth_key
+            session.flush()
+        # The file holds the auth key, so do not leave a copy behind
+        os.remove(path)
+        logger.info(f"Imported session string file: {path}")
+    except Exception as e:
+        logger.error(f"Failed to import session string file: {e}")
+
+def save_session(client: TelegramClient) -> bool:
+    """Commit the client's pending session changes to the session file"""
+    session = client.session
+    if not isinstance(session, BufferedSQLiteSession):
+        return False
+    
+    try:
+        session.flush()
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save session: {e}")
+        return False
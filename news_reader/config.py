@@ -1,31 +1,58 @@
 import os
+from dataclasses import dataclass, fields
+from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Defaults for variables that are unset or empty; other text fields default to '' and numbers to 0
+_ENV_DEFAULTS = {
+    'LLM_MODEL_NAME': 'gpt-3.5-turbo'
+}
 
+@dataclass(frozen=True, slots=True)
 class Config:
     # Telegram API credentials
-    API_ID = int(os.getenv('API_ID', '0'))
-    API_HASH = os.getenv('API_HASH', '')
-    PHONE_NUMBER = os.getenv('PHONE_NUMBER', '')
-    SESSION_NAME = os.getenv('SESSION_NAME', '')
+    API_ID: int
+    API_HASH: str
+    PHONE_NUMBER: str
+    SESSION_NAME: str
+    SESSION_STRING: str  # Optional: saved StringSession, skips login on startup
     
     # OpenAI API configuration
-    LLM_API_KEY = os.getenv('LLM_API_KEY', '')  # OpenAI API key
-    LLM_MODEL_NAME = os.getenv('LLM_MODEL_NAME', 'gpt-3.5-turbo')  # OpenAI model name
-    LLM_ENDPOINT_URL = os.getenv('LLM_ENDPOINT_URL', '')  # Optional: Custom base URL for OpenAI-compatible APIs
+    LLM_API_KEY: str  # OpenAI API key
+    LLM_MODEL_NAME: str  # OpenAI model name
+    LLM_ENDPOINT_URL: str  # Optional: Custom base URL for OpenAI-compatible APIs
     
     # Channel configuration
-    SINK_CHANNEL = int(os.getenv('SINK_CHANNEL', ''))  # Channel ID or username to send summaries to
+    SINK_CHANNEL: int  # Channel ID to send summaries to
     
     @classmethod
-    def validate(cls):
+    def from_env(cls) -> 'Config':
+        """Read the configuration from environment variables (and .env)"""
+        load_dotenv()
+        # Each field is named after its environment variable, so read them all from one snapshot
+        env = os.environ.copy()
+        values = {}
+        for field in fields(cls):
+            value = env.get(field.name) or _ENV_DEFAULTS.get(field.name, '')
+            values[field.name] = int(value or 0) if field.type is int else value
+        return cls(**values)
+    
+    def validate(self):
         """Validate required configuration"""
-        if not cls.API_ID or cls.API_ID == 0:
+        if not self.API_ID or self.API_ID == 0:
             raise ValueError("API_ID is required")
-        if not cls.API_HASH:
+        if not self.API_HASH:
             raise ValueError("API_HASH is required")
-        if not cls.PHONE_NUMBER:
+        if not self.PHONE_NUMBER:
             raise ValueError("PHONE_NUMBER is required")
         return True
+
+# Global instance
+_config: Optional[Config] = None
+
+def get_config() -> Config:
+    """Get the global configuration, reading the environment only once"""
+    global _config
+    if _config is None:
+        _config = Config.from_env()
+    return _config
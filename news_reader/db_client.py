@@ -1,18 +1,83 @@
 #!/usr/bin/env python3
 """
-Database Client - Client for interacting with TinyDB
+Database Client - Client for interacting with TinyDB and SQLite
 """
 
-from typing import List, Dict, Any
+import atexit
+from collections import namedtuple
+from typing import Iterable, List, Dict, Any, Optional
 import os
-from datetime import datetime
+import sqlite3
+import threading
 from news_reader.logging_config import get_logger
 from news_reader.message_utils import get_current_timestamp
 
 logger = get_logger(__name__)
 
+# TinyDB table holding each record type. Each table holds at most one record, see _replace_record
+RECORD_TABLES = {
+    "cached_channels": "cached_channels",
+    "session_data": "session_data"
+}
+
+# Incoming message fields, in column order
+MESSAGE_COLUMNS = (
+    'message_id', 'chat_id', 'chat_name', 'sender_id', 'sender_name', 'message_text',
+    'timestamp', 'message_link', 'received_at', 'llm_summary', 'summary_generated_at'
+)
+
+# Channel configuration tables, keyed by channel_id (INTEGER PRIMARY KEY is a unique B-tree index)
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS monitoring_channels (
+    channel_id INTEGER PRIMARY KEY,
+    updated_at TEXT,
+    updated_by TEXT
+);
+CREATE TABLE IF NOT EXISTS channel_info (
+    channel_id INTEGER PRIMARY KEY,
+    channel_title TEXT,
+    channel_username TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS incoming_messages (
+    id INTEGER PRIMARY KEY,
+    message_id INTEGER,
+    chat_id INTEGER,
+    chat_name TEXT,
+    sender_id INTEGER,
+    sender_name TEXT,
+    message_text TEXT,
+    timestamp TEXT,
+    message_link TEXT,
+    received_at TEXT,
+    llm_summary TEXT,
+    summary_generated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS incoming_messages_message_id ON incoming_messages (message_id);
+CREATE INDEX IF NOT EXISTS incoming_messages_without_summary ON incoming_messages (id) WHERE llm_summary IS NULL;
+"""
+
+# Channel info row passed to add_channel_info_bulk, read by position
+ChannelRow = namedtuple('ChannelRow', 'channel_id channel_title channel_username')
+
+# Appended to incoming_messages, with values taken by name from a message record
+INSERT_MESSAGE_SQL = (
+    f"INSERT INTO incoming_messages ({', '.join(MESSAGE_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in MESSAGE_COLUMNS)})"
+)
+SELECT_MESSAGES_SQL = f"SELECT {', '.join(MESSAGE_COLUMNS)} FROM incoming_messages"
+
+# Update the existing row in place, inserting only when the channel is new
+UPSERT_CHANNEL_INFO_SQL = """
+INSERT INTO channel_info (channel_id, channel_title, channel_username, updated_at) VALUES (?, ?, ?, ?)
+ON CONFLICT (channel_id) DO UPDATE SET
+    channel_title = excluded.channel_title,
+    channel_username = excluded.channel_username,
+    updated_at = excluded.updated_at
+"""
+
 class TinyDBClient:
-    """Database client using TinyDB for local JSON database"""
+    """Database client using TinyDB for local JSON database and SQLite for channel configuration and incoming messages"""
     
     def __init__(self, db_path: str = None):
         """Initialize TinyDB client"""
@@ -24,17 +89,56 @@ class TinyDBClient:
                 db_path = 'monitoring_config.json'
         
         self.db_path = db_path
+        self.sqlite_path = os.path.splitext(db_path)[0] + '.db'
         self._ensure_db_dir()
         
+        # In-memory index of channel configuration, built lazily from the first read.
+        # The lock serializes all database access, since callers may run in worker threads.
+        self._lock = threading.RLock()
+        self._monitored_channels: Optional[List[int]] = None
+        self._channel_info_by_id: Dict[int, Dict[str, Any]] = {}
+        
+        # Cached channels list and its summary, kept until the cache is rewritten or cleared
+        self._cached_channels: Optional[List[Dict[str, Any]]] = None
+        self._cache_info: Optional[Dict[str, Any]] = None
+        
+        # Change tracking for get_monitored_channels_if_changed
+        self._data_version: Optional[int] = None
+        self._last_polled_channels: Optional[List[int]] = None
+        
         # Initialize TinyDB
         try:
             from tinydb import TinyDB, Query
-            self.db = TinyDB(self.db_path)
+            from tinydb.middlewares import CachingMiddleware
+            from news_reader.json_storage import FastJSONStorage
+            # Keep the database in memory and write it out on flush(), instead of
+            # reading and rewriting the whole file on every operation
+            self.db = TinyDB(self.db_path, storage=CachingMiddleware(FastJSONStorage))
+            atexit.register(self.flush)
             self.Query = Query()  # Create Query instance
+            self.tables = {record_type: self.db.table(name) for record_type, name in RECORD_TABLES.items()}
+            self._partition_tinydb()
             logger.info(f"Initialized TinyDB at: {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize TinyDB: {e}")
             raise
+        
+        # Initialize SQLite
+        try:
+            self.conn = sqlite3.connect(self.sqlite_path, check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent, only the last commits may be lost on power failure
+            self.conn.executescript(SQLITE_SCHEMA)
+            self._migrate_from_tinydb()
+            self._migrate_messages_from_tinydb()
+            logger.info(f"Initialized SQLite at: {self.sqlite_path}")
+        except Exception as e:
+            logger.error(f"Failed to initialize SQLite: {e}")
+            raise
+        
+        # Persist any records the migrations moved out of TinyDB right away
+        self.flush()
     
     def _ensure_db_dir(self):
         """Ensure database directory exists"""
@@ -42,51 +146,170 @@ class TinyDBClient:
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir, exist_ok=True)
     
+    def _migrate_from_tinydb(self):
+        """Move channel configuration records left in TinyDB by older versions into SQLite"""
+        is_monitoring_config = self.Query.type == "monitoring_channels"
+        is_channel_info = self.Query.type == "channel_info"
+        monitoring_configs = self.db.search(is_monitoring_config)
+        channel_infos = self.db.search(is_channel_info)
+        if not monitoring_configs and not channel_infos:
+            return
+        
+        with self.conn:
+            if monitoring_configs:
+                latest_config = max(monitoring_configs, key=lambda x: x.get('updated_at', ''))
+                self.conn.execute("DELETE FROM monitoring_channels")
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO monitoring_channels (channel_id, updated_at, updated_by) VALUES (?, ?, ?)",
+                    [(channel_id, latest_config.get('updated_at'), latest_config.get('updated_by'))
+                     for channel_id in latest_config.get('channels', [])]
+                )
+            self.conn.executemany(
+                UPSERT_CHANNEL_INFO_SQL,
+                [(info.get('channel_id'), info.get('channel_title'), info.get('channel_username'), info.get('updated_at'))
+                 for info in channel_infos]
+            )
+        
+        self.db.remove(is_monitoring_config | is_channel_info)
+        logger.info(f"Migrated {len(monitoring_configs)} monitoring configs and {len(channel_infos)} channel infos from TinyDB to SQLite")
+    
+    def _migrate_messages_from_tinydb(self):
+        """Move incoming messages stored in TinyDB by older versions into SQLite"""
+        is_incoming_message = self.Query.type == "incoming_message"
+        records = self.db.search(is_incoming_message)
+        if not records:
+            return
+        
+        with self.conn:
+            self.conn.executemany(
+                INSERT_MESSAGE_SQL,
+                [{column: record.get(column) for column in MESSAGE_COLUMNS} for record in records]
+            )
+        
+        self.db.remove(is_incoming_message)
+        logger.info(f"Migrated {len(records)} incoming messages from TinyDB to SQLite")
+    
+    def _partition_tinydb(self):
+        """Move records kept in the default TinyDB table by older versions into their own tables"""
+        legacy_records = [doc for doc in self.db.all() if doc.get('type') in RECORD_TABLES]
+        if not legacy_records:
+            return
+        
+        for record_type, table in self.tables.items():
+            records = [doc for doc in legacy_records if doc['type'] == record_type]
+            if records:
+                # Older versions could leave several copies behind, keep only the latest
+                self._replace_record(dict(records[-1]))
+        self.db.remove(doc_ids=[doc.doc_id for doc in legacy_records])
+        logger.info(f"Moved {len(legacy_records)} records from the default TinyDB table into per-type tables")
+    
+    def _get_record(self, record_type: str) -> Optional[Dict[str, Any]]:
+        """Get the single document of a record type, or None if there is none"""
+        return next(iter(self.tables[record_type]), None)
+    
+    def _replace_record(self, record: Dict[str, Any]) -> None:
+        """Store the single document of a record type, overwriting it in place when it exists"""
+        table = self.tables[record['type']]
+        doc = self._get_record(record['type'])
+        if doc is None:
+            table.insert(record)
+        else:
+            table.update(record, doc_ids=[doc.doc_id])
+    
+    def _load_index(self):
+        """Build the in-memory index of channel configuration if not loaded yet"""
+        if self._monitored_channels is not None:
+            return
+        
+        monitored_channels = [row['channel_id'] for row in self.conn.execute("SELECT channel_id FROM monitoring_channels")]
+        channel_info_by_id = {
+            row['channel_id']: dict(row, type="channel_info")
+            for row in self.conn.execute("SELECT * FROM channel_info")
+        }
+        
+        self._channel_info_by_id = channel_info_by_id
+        self._monitored_channels = monitored_channels
+        logger.debug("Built in-memory index of channel configuration")
+    
+    def flush(self) -> bool:
+        """Write pending TinyDB changes to disk"""
+        try:
+            with self._lock:
+                self.db.storage.flush()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to flush database: {e}")
+            return False
+    
     def health_check(self) -> bool:
         """Check if database is accessible"""
         try:
             # Try to read from database
-            self.db.all()
+            with self._lock:
+                self.db.all()
+                self.conn.execute("SELECT 1")
             return True
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return False
     
     def get_monitored_channels(self) -> List[int]:
-        """Get list of monitored channel IDs"""
+        """Get list of monitored channel IDs (shared with the in-memory index, do not modify it)"""
         try:
-            # Look for monitoring configuration
-            configs = self.db.search(self.Query.type == "monitoring_channels")
+            with self._lock:
+                self._load_index()
+                # Writes replace the list instead of changing it, so it can be handed out as is
+                channels = self._monitored_channels
             
-            if configs:
-                # Get the most recent configuration
-                latest_config = max(configs, key=lambda x: x.get('updated_at', ''))
-                channels = latest_config.get('channels', [])
+            if channels:
                 logger.info(f"Retrieved {len(channels)} monitored channels from database")
-                return channels
             else:
                 logger.info("No monitoring channels configuration found in database")
-                return []
+            return channels
                 
         except Exception as e:
             logger.error(f"Failed to get monitored channels: {e}")
             return []
     
-    def set_monitored_channels(self, channels: List[int], user: str = 'system') -> bool:
+    def get_monitored_channels_if_changed(self) -> Optional[List[int]]:
+        """Get monitored channel IDs if they changed since the previous call, otherwise None"""
+        try:
+            with self._lock:
+                # data_version only moves when another connection commits, so this is
+                # cheap to poll and tells us when the in-memory index went stale
+                data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version != self._data_version:
+                    self._data_version = data_version
+                    self._monitored_channels = None
+                
+                self._load_index()
+                if self._monitored_channels == self._last_polled_channels:
+                    return None
+                
+                self._last_polled_channels = list(self._monitored_channels)
+                return list(self._monitored_channels)
+                
+        except Exception as e:
+            logger.error(f"Failed to check monitored channels for changes: {e}")
+            return None
+    
+    def set_monitored_channels(self, channels: Iterable[int], user: str = 'system') -> bool:
         """Set monitored channel IDs"""
         try:
-            # Remove existing monitoring configurations
-            self.db.remove(self.Query.type == "monitoring_channels")
+            # Accept any iterable (list, set, generator) and canonicalize it once: ints, duplicates dropped, order kept
+            channels = list(dict.fromkeys(int(channel_id) for channel_id in channels))
+            updated_at = get_current_timestamp()
             
-            # Add new configuration
-            config_data = {
-                "type": "monitoring_channels",
-                "channels": channels,
-                "updated_at": get_current_timestamp(),
-                "updated_by": user
-            }
+            # Replace the whole configuration in a single transaction
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM monitoring_channels")
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO monitoring_channels (channel_id, updated_at, updated_by) VALUES (?, ?, ?)",
+                    [(channel_id, updated_at, user) for channel_id in channels]
+                )
+                if self._monitored_channels is not None:
+                    self._monitored_channels = channels
             
-            self.db.insert(config_data)
             logger.info(f"Successfully saved {len(channels)} monitored channels to database")
             return True
             
@@ -98,7 +321,10 @@ class TinyDBClient:
         """Clear all monitored channels"""
         try:
             # Remove all monitoring configurations
-            self.db.remove(self.Query.type == "monitoring_channels")
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM monitoring_channels")
+                if self._monitored_channels is not None:
+                    self._monitored_channels = []
             
             logger.info("Successfully cleared all monitored channels from database")
             return True
@@ -110,8 +336,13 @@ class TinyDBClient:
     def get_all_config(self) -> Dict[str, Any]:
         """Get all configuration data"""
         try:
-            all_data = self.db.all()
-            return {"configurations": all_data}
+            with self._lock:
+                all_data = [record for table in self.tables.values() for record in table]
+                return {
+                    "configurations": all_data,
+                    "monitoring_channels": [dict(row) for row in self.conn.execute("SELECT * FROM monitoring_channels")],
+                    "channel_info": [dict(row) for row in self.conn.execute("SELECT * FROM channel_info")]
+                }
         except Exception as e:
             logger.error(f"Failed to get all config: {e}")
             return {}
@@ -119,19 +350,21 @@ class TinyDBClient:
     def add_channel_info(self, channel_id: int, channel_title: str, channel_username: str = None) -> bool:
         """Add or update channel information"""
         try:
-            # Remove existing channel info if it exists
-            self.db.remove((self.Query.type == "channel_info") & (self.Query.channel_id == channel_id))
-            
-            # Add new channel info
             channel_data = {
                 "type": "channel_info",
                 "channel_id": channel_id,
                 "channel_title": channel_title,
                 "channel_username": channel_username,
-                "updated_at": datetime.now().isoformat()
+                "updated_at": get_current_timestamp()
             }
             
-            self.db.insert(channel_data)
+            with self._lock, self.conn:
+                self.conn.execute(
+                    UPSERT_CHANNEL_INFO_SQL,
+                    (channel_id, channel_title, channel_username, channel_data["updated_at"])
+                )
+                if self._monitored_channels is not None:
+                    self._channel_info_by_id[channel_id] = channel_data
             logger.info(f"Added channel info for: {channel_title} ({channel_id})")
             return True
             
@@ -139,24 +372,59 @@ class TinyDBClient:
             logger.error(f"Failed to add channel info: {e}")
             return False
     
+    def add_channel_info_bulk(self, channels: List[ChannelRow]) -> bool:
+        """Add or update information for many channels in a single transaction"""
+        try:
+            updated_at = get_current_timestamp()
+            
+            with self._lock, self.conn:
+                self.conn.executemany(
+                    UPSERT_CHANNEL_INFO_SQL,
+                    [(row[0], row[1], row[2], updated_at) for row in channels]
+                )
+                if self._monitored_channels is not None:
+                    for row in channels:
+                        self._channel_info_by_id[row[0]] = {
+                            "type": "channel_info",
+                            "channel_id": row[0],
+                            "channel_title": row[1],
+                            "channel_username": row[2],
+                            "updated_at": updated_at
+                        }
+            logger.info(f"Added channel info for {len(channels)} channels")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to add channel info in bulk: {e}")
+            return False
+    
     def get_channel_info(self, channel_id: int) -> Dict[str, Any]:
         """Get channel information by ID"""
         try:
-            channel_info = self.db.search((self.Query.type == "channel_info") & (self.Query.channel_id == channel_id))
-            if channel_info:
-                return channel_info[0]
-            return {}
+            with self._lock:
+                self._load_index()
+                return self._channel_info_by_id.get(channel_id, {})
         except Exception as e:
             logger.error(f"Failed to get channel info: {e}")
             return {}
     
+    def get_channel_infos(self, channel_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Get information for several channels at once, keyed by channel ID"""
+        try:
+            with self._lock:
+                self._load_index()
+                return {
+                    channel_id: self._channel_info_by_id[channel_id]
+                    for channel_id in channel_ids
+                    if channel_id in self._channel_info_by_id
+                }
+        except Exception as e:
+            logger.error(f"Failed to get channel infos: {e}")
+            return {}
+    
     def cache_channels_list(self, channels: List[Dict[str, Any]], user: str = 'system') -> bool:
         """Cache the complete channels list"""
         try:
-            # Remove existing cached channels
-            self.db.remove(self.Query.type == "cached_channels")
-            
-            # Add new cached channels
             cache_data = {
                 "type": "cached_channels",
                 "channels": channels,
@@ -164,7 +432,11 @@ class TinyDBClient:
                 "cached_by": user
             }
             
-            self.db.insert(cache_data)
+            with self._lock:
+                # Replace existing cached channels with a single write
+                self._replace_record(cache_data)
+                self._cached_channels = channels
+                self._cache_info = self._make_cache_info(cache_data)
             logger.info(f"Successfully cached {len(channels)} channels to database")
             return True
             
@@ -173,21 +445,22 @@ class TinyDBClient:
             return False
     
     def get_cached_channels(self) -> List[Dict[str, Any]]:
-        """Get cached channels list"""
+        """Get cached channels list (kept in memory and shared between callers, do not modify it)"""
         try:
-            # Look for cached channels
-            cached_data = self.db.search(self.Query.type == "cached_channels")
+            # Served from memory once loaded, cache_channels_list and clear_cached_channels keep it current
+            with self._lock:
+                if self._cached_channels is not None:
+                    return self._cached_channels
+                latest_cache = self._get_record("cached_channels")
+                channels = latest_cache.get('channels', []) if latest_cache else []
+                self._cached_channels = channels
             
-            if cached_data:
-                # Get the most recent cache
-                latest_cache = max(cached_data, key=lambda x: x.get('cached_at', ''))
-                channels = latest_cache.get('channels', [])
+            if latest_cache:
                 cached_at = latest_cache.get('cached_at', 'Unknown')
                 logger.info(f"Retrieved {len(channels)} cached channels from database (cached at: {cached_at})")
-                return channels
             else:
                 logger.info("No cached channels found in database")
-                return []
+            return channels
                 
         except Exception as e:
             logger.error(f"Failed to get cached channels: {e}")
@@ -196,8 +469,11 @@ class TinyDBClient:
     def clear_cached_channels(self) -> bool:
         """Clear cached channels"""
         try:
-            # Remove all cached channels
-            self.db.remove(self.Query.type == "cached_channels")
+            # Remove all cached channels, emptying the table without matching its documents
+            with self._lock:
+                self.tables["cached_channels"].truncate()
+                self._cached_channels = None
+                self._cache_info = None
             
             logger.info("Successfully cleared cached channels from database")
             return True
@@ -209,42 +485,89 @@ class TinyDBClient:
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about the cached channels"""
         try:
-            cached_data = self.db.search(self.Query.type == "cached_channels")
+            with self._lock:
+                # Only the first call scans the table, writes keep the summary up to date
+                if self._cache_info is None:
+                    self._cache_info = self._make_cache_info(self._get_record("cached_channels"))
+                return dict(self._cache_info)
+                
+        except Exception as e:
+            logger.error(f"Failed to get cache info: {e}")
+            return {"has_cache": False}
+    
+    @staticmethod
+    def _make_cache_info(cache_record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summarize a cached channels record for get_cache_info"""
+        if not cache_record:
+            return {"has_cache": False}
+        return {
+            "has_cache": True,
+            "channels_count": len(cache_record.get('channels', [])),
+            "cached_at": cache_record.get('cached_at', 'Unknown'),
+            "cached_by": cache_record.get('cached_by', 'Unknown')
+        }
+    
+    def save_session_data(self, session_data: Dict[str, Any]) -> bool:
+        """Save the logged-in user's session data for the next startup"""
+        try:
+            session_record = {
+                "type": "session_data",
+                "session_data": session_data,
+                "saved_at": get_current_timestamp()
+            }
+            
+            with self._lock:
+                # Keep a single session record
+                self._replace_record(session_record)
+            logger.info(f"Saved session data for user: {session_data.get('user_name', 'Unknown')}")
+            return True
             
-            if cached_data:
-                latest_cache = max(cached_data, key=lambda x: x.get('cached_at', ''))
+        except Exception as e:
+            logger.error(f"Failed to save session data: {e}")
+            return False
+    
+    def get_session_data(self) -> Dict[str, Any]:
+        """Get the saved session data along with the time it was saved"""
+        try:
+            with self._lock:
+                session_record = self._get_record("session_data")
+            
+            if session_record:
                 return {
-                    "has_cache": True,
-                    "channels_count": len(latest_cache.get('channels', [])),
-                    "cached_at": latest_cache.get('cached_at', 'Unknown'),
-                    "cached_by": latest_cache.get('cached_by', 'Unknown')
+                    "session_data": session_record.get('session_data', {}),
+                    "saved_at": session_record.get('saved_at')
                 }
             else:
-                return {"has_cache": False}
+                return {}
                 
         except Exception as e:
-            logger.error(f"Failed to get cache info: {e}")
-            return {"has_cache": False}
+            logger.error(f"Failed to get session data: {e}")
+            return {}
+    
+    @staticmethod
+    def _make_message_record(message_data: Dict[str, Any], received_at: str) -> Dict[str, Any]:
+        """Build the stored record for an incoming message"""
+        return {
+            "message_id": message_data.get('message_id'),
+            "chat_id": message_data.get('chat_id'),
+            "chat_name": message_data.get('chat_name'),
+            "sender_id": message_data.get('sender_id'),
+            "sender_name": message_data.get('sender_name'),
+            "message_text": message_data.get('message_text'),
+            "timestamp": message_data.get('timestamp'),
+            "message_link": message_data.get('message_link'),  # Store message link
+            "received_at": received_at,
+            "llm_summary": message_data.get('llm_summary'),  # Store LLM summary
+            "summary_generated_at": message_data.get('summary_generated_at')  # When summary was created
+        }
     
     def save_incoming_message(self, message_data: Dict[str, Any]) -> bool:
         """Save an incoming message to the database"""
         try:
-            message_record = {
-                "type": "incoming_message",
-                "message_id": message_data.get('message_id'),
-                "chat_id": message_data.get('chat_id'),
-                "chat_name": message_data.get('chat_name'),
-                "sender_id": message_data.get('sender_id'),
-                "sender_name": message_data.get('sender_name'),
-                "message_text": message_data.get('message_text'),
-                "timestamp": message_data.get('timestamp'),
-                "message_link": message_data.get('message_link'),  # Store message link
-                "received_at": get_current_timestamp(),
-                "llm_summary": message_data.get('llm_summary'),  # Store LLM summary
-                "summary_generated_at": message_data.get('summary_generated_at')  # When summary was created
-            }
+            message_record = self._make_message_record(message_data, get_current_timestamp())
             
-            self.db.insert(message_record)
+            with self._lock, self.conn:
+                self.conn.execute(INSERT_MESSAGE_SQL, message_record)
             logger.debug(f"Saved incoming message from {message_data.get('sender_name')} in {message_data.get('chat_name')}")
             return True
             
@@ -252,10 +575,30 @@ class TinyDBClient:
             logger.error(f"Failed to save incoming message: {e}")
             return False
     
+    def save_incoming_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """Save a batch of incoming messages in a single transaction and return how many were saved"""
+        if not messages:
+            return 0
+        
+        try:
+            received_at = get_current_timestamp()
+            message_records = [self._make_message_record(message_data, received_at) for message_data in messages]
+            
+            with self._lock, self.conn:
+                self.conn.executemany(INSERT_MESSAGE_SQL, message_records)
+            logger.debug(f"Saved {len(message_records)} incoming messages")
+            return len(message_records)
+            
+        except Exception as e:
+            logger.error(f"Failed to save incoming messages: {e}")
+            return 0
+    
     def get_all_incoming_messages(self) -> List[Dict[str, Any]]:
         """Get all incoming messages from the database"""
         try:
-            messages = self.db.search(self.Query.type == "incoming_message")
+            with self._lock:
+                rows = self.conn.execute(f"{SELECT_MESSAGES_SQL} ORDER BY id").fetchall()
+            messages = [dict(row, type="incoming_message") for row in rows]
             logger.info(f"Retrieved {len(messages)} incoming messages from database")
             return messages
             
@@ -266,8 +609,8 @@ class TinyDBClient:
     def clear_incoming_messages(self) -> bool:
         """Clear all incoming messages from the database"""
         try:
-            removed_count = len(self.db.search(self.Query.type == "incoming_message"))
-            self.db.remove(self.Query.type == "incoming_message")
+            with self._lock, self.conn:
+                removed_count = self.conn.execute("DELETE FROM incoming_messages").rowcount
             logger.info(f"Successfully cleared {removed_count} incoming messages from database")
             return True
             
@@ -278,15 +621,12 @@ class TinyDBClient:
     def update_message_summary(self, message_id: int, summary: str) -> bool:
         """Update a message with its LLM-generated summary"""
         try:
-            # Find and update the message
-            updated = self.db.update(
-                {
-                    'llm_summary': summary,
-                    'summary_generated_at': get_current_timestamp()
-                },
-                (self.Query.type == "incoming_message") & 
-                (self.Query.message_id == message_id)
-            )
+            # Find and update the message through the message_id index
+            with self._lock, self.conn:
+                updated = self.conn.execute(
+                    "UPDATE incoming_messages SET llm_summary = ?, summary_generated_at = ? WHERE message_id = ?",
+                    (summary, get_current_timestamp(), message_id)
+                ).rowcount
             
             if updated:
                 logger.debug(f"Updated message {message_id} with LLM summary")
@@ -299,13 +639,34 @@ class TinyDBClient:
             logger.error(f"Failed to update message summary: {e}")
             return False
     
+    def update_message_summaries(self, summaries: Dict[int, str]) -> int:
+        """Update several messages with their LLM-generated summaries in one transaction and return how many rows changed"""
+        if not summaries:
+            return 0
+        
+        try:
+            summary_generated_at = get_current_timestamp()
+            with self._lock, self.conn:
+                cursor = self.conn.executemany(
+                    "UPDATE incoming_messages SET llm_summary = ?, summary_generated_at = ? WHERE message_id = ?",
+                    [(summary, summary_generated_at, message_id) for message_id, summary in summaries.items()]
+                )
+                updated = cursor.rowcount
+            
+            logger.debug(f"Updated {updated} messages with LLM summaries")
+            return updated
+            
+        except Exception as e:
+            logger.error(f"Failed to update message summaries: {e}")
+            return 0
+    
     def get_messages_without_summary(self) -> List[Dict[str, Any]]:
         """Get all incoming messages that don't have LLM summaries yet"""
         try:
-            messages = self.db.search(
-                (self.Query.type == "incoming_message") & 
-                (~self.Query.llm_summary.exists() | (self.Query.llm_summary == None))
-            )
+            # Served from the partial index over messages without a summary
+            with self._lock:
+                rows = self.conn.execute(f"{SELECT_MESSAGES_SQL} WHERE llm_summary IS NULL ORDER BY id").fetchall()
+            messages = [dict(row, type="incoming_message") for row in rows]
             logger.info(f"Found {len(messages)} messages without summaries")
             return messages
             
@@ -313,10 +674,18 @@ class TinyDBClient:
             logger.error(f"Failed to get messages without summaries: {e}")
             return []
 
+# Global instance
+_db_client: Optional[TinyDBClient] = None
+
 def get_db_client() -> TinyDBClient:
-    """Get database client instance"""
+    """Get or create database client instance"""
+    global _db_client
+    if _db_client is not None:
+        return _db_client
+    
     try:
-        return TinyDBClient()
+        _db_client = TinyDBClient()
+        return _db_client
     except Exception as e:
         logger.error(f"Failed to create database client: {e}")
         logger.error("Database is required for the application to function properly")
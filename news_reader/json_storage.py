@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+JSON Storage - TinyDB storage backend tuned for the News Reader database file
+"""
+
+import json
+import logging
+import mmap
+import os
+from typing import Dict, Any, Optional
+from tinydb.storages import JSONStorage
+from news_reader.logging_config import get_logger
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+logger = get_logger(__name__)
+
+# Flushing the file data is enough, the metadata fsync also writes is not needed to read it back
+_sync = getattr(os, 'fdatasync', os.fsync)
+
+class FastJSONStorage(JSONStorage):
+    """JSONStorage that parses the database file through a read-only memory map, using orjson when available"""
+    
+    def __init__(self, path: str, create_dirs=False, encoding=None, access_mode='rb+', **kwargs):
+        """Open the database file in binary mode so serialized bytes are written without re-encoding"""
+        super().__init__(path, create_dirs=create_dirs, encoding=encoding, access_mode=access_mode, **kwargs)
+    
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read the database state, mapping the file instead of streaming it through the text wrapper"""
+        self._handle.seek(0, os.SEEK_END)
+        if not self._handle.tell():
+            # Empty file - let TinyDB initialize the database
+            return None
+        
+        with mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is not None:
+                # orjson parses the mapping in place, without copying it first
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
+    
+    def write(self, data: Dict[str, Dict[str, Any]]):
+        """Serialize the database state and replace the file contents"""
+        # Compact output by default; indent only when debugging
+        pretty = logger.isEnabledFor(logging.DEBUG)
+        
+        if orjson is not None:
+            serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+        else:
+            # Keep non-ASCII text (channel titles, messages) as UTF-8 instead of \u escapes, like orjson
+            json_kwargs = {'indent': 2} if pretty else {'separators': (',', ':')}
+            json_kwargs['ensure_ascii'] = False
+            json_kwargs.update(self.kwargs)
+            serialized = json.dumps(data, **json_kwargs).encode('utf-8')
+        
+        if hasattr(os, 'pwrite'):
+            # Write straight to the descriptor kept open by JSONStorage, bypassing the buffered handle
+            fd = self._handle.fileno()
+            os.pwrite(fd, serialized, 0)
+            os.ftruncate(fd, len(serialized))
+            _sync(fd)
+            return
+        
+        self._handle.seek(0)
+        self._handle.write(serialized)
+        
+        # Ensure the file has been written, then drop any leftover tail
+        self._handle.flush()
+        _sync(self._handle.fileno())
+        self._handle.truncate()
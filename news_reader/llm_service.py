@@ -9,7 +9,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from openai import AsyncOpenAI
 from news_reader.logging_config import get_logger
-from news_reader.config import Config
+from news_reader.config import get_config
 
 logger = get_logger(__name__)
 
@@ -18,9 +18,10 @@ class LLMService:
     
     def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None, base_url: Optional[str] = None):
         """Initialize LLM service with OpenAI configuration"""
-        self.api_key = api_key if api_key is not None else Config.LLM_API_KEY
-        self.model_name = model_name if model_name is not None else (Config.LLM_MODEL_NAME or "gpt-3.5-turbo")
-        self.base_url = base_url if base_url is not None else Config.LLM_ENDPOINT_URL
+        config = get_config()
+        self.api_key = api_key if api_key is not None else config.LLM_API_KEY
+        self.model_name = model_name if model_name is not None else (config.LLM_MODEL_NAME or "gpt-3.5-turbo")
+        self.base_url = base_url if base_url is not None else config.LLM_ENDPOINT_URL
         
         if not self.api_key or self.api_key.strip() == '':
             logger.warning("OpenAI API key not provided. LLM processing will be disabled.")
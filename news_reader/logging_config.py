@@ -3,10 +3,16 @@
 Logging Configuration - Centralized logging setup for the News Reader application
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 
+# Background listener that writes queued log records to the log file
+_listener = None
+
 def setup_logging(log_level=logging.INFO):
     """
     Setup centralized logging configuration for the entire application.
@@ -20,24 +26,40 @@ def setup_logging(log_level=logging.INFO):
     project_root = current_dir.parent
     log_file_path = project_root / 'logs.txt'
     
-    # Configure logging
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        filename=str(log_file_path),
-        filemode='a',  # Append mode to keep historical logs
-        force=True  # Override any existing configuration
-    )
+    # Replace the listener of an earlier setup_logging call
+    _stop_listener()
+    
+    # The calling thread (often the event loop) only puts records on a queue;
+    # the file write happens on the listener's thread
+    file_handler = logging.FileHandler(str(log_file_path), mode='a')  # Append mode to keep historical logs
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    log_queue = queue.SimpleQueue()
     
-    # Also ensure the root logger doesn't propagate to console
+    # Override any existing configuration, including handlers that might output to console
     root_logger = logging.getLogger()
-    # Remove any existing handlers that might output to console
     for handler in root_logger.handlers[:]:
-        if isinstance(handler, logging.StreamHandler) and handler.stream.name in ['<stdout>', '<stderr>']:
-            root_logger.removeHandler(handler)
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    global _listener
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
     
     return str(log_file_path)
 
+def _stop_listener():
+    """Write out any queued log records before the process exits"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(_stop_listener)
+
 def get_logger(name):
     """
     Get a logger instance with the specified name.
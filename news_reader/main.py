@@ -8,7 +8,16 @@ import sys
 import asyncio
 from news_reader.app import NewsReaderApp
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
+
 if __name__ == '__main__':
+    # Use the libuv-based event loop for Telethon's socket traffic when available
+    if uvloop is not None and sys.platform != 'win32':
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     app = NewsReaderApp()
     
     try:
@@ -4,24 +4,37 @@ Monitoring Task - Handles Telegram message monitoring
 """
 
 import asyncio
-from typing import List
-from datetime import datetime
-from telethon import TelegramClient, events, utils
-from colorama import Fore
+import time
+from typing import AbstractSet, FrozenSet, Iterable, List, Optional, Set
+from telethon import TelegramClient, events
 from news_reader.logging_config import get_logger
 from news_reader.db_client import get_db_client
 from news_reader.llm_service import get_llm_service
 from news_reader.channel_sender import get_channel_sender
-from news_reader.config import Config
 from news_reader.message_utils import get_sender_name, get_current_timestamp, format_message_for_display, create_telegram_message_link
 
 logger = get_logger(__name__)
 
+# Per-message log line, formatted by logging only when INFO is enabled
+NEW_MESSAGE_LOG_FORMAT = "New message from %s in %s: %s"
+
+# New messages are collected for up to UPDATE_BATCH_WINDOW seconds, or UPDATE_BATCH_SIZE
+# messages, and then processed together by a single task
+UPDATE_BATCH_WINDOW = 0.05
+UPDATE_BATCH_SIZE = 32
+
+# How often to check the database for channel changes made outside this process (seconds)
+CHANNELS_POLL_INTERVAL = 30
+
 class MonitoringTask:
-    def __init__(self, client: TelegramClient, monitored_channels: List[int]):
+    def __init__(self, client: TelegramClient, monitored_channels: AbstractSet[int]):
         self.client = client
-        self.monitored_channels = monitored_channels
+        self.monitored_channels: FrozenSet[int] = frozenset(monitored_channels)
         self.running = False
+        self._handler_registered = False
+        self._burst_buffer: List[events.NewMessage.Event] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
         self.db_client = get_db_client()  # Database client for saving messages
         self.llm_service = get_llm_service()  # LLM service for message summarization
         self.channel_sender = get_channel_sender(client)  # Channel sender for SINK_CHANNEL
@@ -135,6 +148,90 @@ class MonitoringTask:
         sender_name = get_sender_name(message_data)
         logger.debug(f"REST post from {sender_name} - no action taken")
     
+    async def _handle_new_message(self, event) -> Optional[dict]:
+        """Handle a new message from one of the monitored channels and return its data for saving"""
+        try:
+            # Prefer entities shipped with the update, fetching them only when missing
+            chat = event.chat or await event.get_chat()
+            sender = event.sender or await event.get_sender()
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            sender_name = getattr(sender, 'first_name', 'Unknown') or 'Unknown'
+            chat_name = getattr(chat, 'title', getattr(chat, 'first_name', 'Private'))
+            
+            # Read the message text once; format_message_for_display only slices when it is too long
+            text = event.text or ''
+            message_text = format_message_for_display(text)
+            
+            # Create message link
+            message_link = create_telegram_message_link(chat.id, event.id)
+            
+            # Prepare message data
+            message_data = {
+                'message_id': event.id,
+                'chat_id': chat.id,
+                'chat_name': chat_name,
+                'sender_id': sender.id if sender else None,
+                'sender_name': sender_name,
+                'message_text': text or '[No text]',
+                'timestamp': timestamp,
+                'message_link': message_link
+            }
+            
+            # Process message according to the algorithm
+            await self._process_message_by_algorithm(message_data, text)
+            
+            logger.info(NEW_MESSAGE_LOG_FORMAT, sender_name, chat_name, message_text)
+            return message_data
+            
+        except Exception as e:
+            logger.error(f"❌ Error handling message: {e}")
+            return None
+    
+    async def _buffer_new_message(self, event) -> None:
+        """Add a new message to the current batch without blocking Telegram's update loop"""
+        self._burst_buffer.append(event)
+        if len(self._burst_buffer) >= UPDATE_BATCH_SIZE:
+            self._flush_burst()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(UPDATE_BATCH_WINDOW, self._flush_burst)
+    
+    def _flush_burst(self) -> None:
+        """Hand the buffered messages to a task that processes them as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._burst_buffer:
+            return
+        
+        batch, self._burst_buffer = self._burst_buffer, []
+        task = asyncio.create_task(self._process_batch(batch))
+        # Keep a reference until done so the task is not garbage collected mid-flight
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _process_batch(self, batch: List[events.NewMessage.Event]) -> None:
+        """Process a batch of new messages concurrently, then save them with a single database write"""
+        results = await asyncio.gather(*(self._handle_new_message(event) for event in batch))
+        
+        messages = [message_data for message_data in results if message_data is not None]
+        if messages:
+            try:
+                await asyncio.to_thread(self.db_client.save_incoming_messages, messages)
+            except Exception as db_error:
+                logger.error(f"Failed to save messages to database: {db_error}")
+    
+    def _register_event_handler(self) -> None:
+        """(Re)register the new message handler filtered to the monitored channels"""
+        # Telethon drops messages from other chats before the handler runs.
+        # Marked integer IDs are matched as-is, without resolving entities over the network.
+        chat_ids = [int(channel_id) for channel_id in self.monitored_channels]
+        self.client.remove_event_handler(self._buffer_new_message)
+        self.client.add_event_handler(
+            self._buffer_new_message,
+            events.NewMessage(chats=chat_ids, blacklist_chats=False)
+        )
+        self._handler_registered = True
+    
     async def start(self):
         """Start monitoring for new messages"""
         if not self.monitored_channels:
@@ -157,83 +254,50 @@ class MonitoringTask:
             logger.info("SINK_CHANNEL not configured - summaries will not be forwarded")
         
         # Register event handlers
-        @self.client.on(events.NewMessage)
-        async def handle_new_message(event):
-            try:
-                chat = await event.get_chat()
-                
-                # Check if message is from a monitored channel
-                # Convert real_id to marked identifier for comparison
-                if hasattr(chat, 'id'):
-                    # Get the marked identifier from the real ID
-                    marked_id = utils.get_peer_id(chat)
-                    if marked_id not in self.monitored_channels:
-                        return  # Skip messages from non-monitored channels
-                
-                sender = await event.get_sender()
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                sender_name = getattr(sender, 'first_name', 'Unknown') or 'Unknown'
-                chat_name = getattr(chat, 'title', getattr(chat, 'first_name', 'Private'))
-                
-                # Format message for GUI display
-                message_text = format_message_for_display(event.text)
-                
-                # Create message link
-                message_link = create_telegram_message_link(chat.id, event.id)
-                
-                # Prepare message data
-                message_data = {
-                    'message_id': event.id,
-                    'chat_id': chat.id,
-                    'chat_name': chat_name,
-                    'sender_id': sender.id if sender else None,
-                    'sender_name': sender_name,
-                    'message_text': event.text or '[No text]',
-                    'timestamp': timestamp,
-                    'message_link': message_link
-                }
-                
-                # Process message according to the algorithm
-                await self._process_message_by_algorithm(message_data, event.text or '')
-                
-                # Save to database
-                try:
-                    self.db_client.save_incoming_message(message_data)
-                except Exception as db_error:
-                    logger.error(f"Failed to save message to database: {db_error}")
-                
-                log_message = (
-                    f"[cyan]📨 [{timestamp}] New message[/cyan]\n"
-                    f"[yellow]👤 From: {sender_name}[/yellow]\n"
-                    f"[blue]💬 Chat: {chat_name} (ID: {chat.id})[/blue]\n"
-                    f"[white]📝 Message: {message_text}[/white]\n"
-                )
-                
-                logger.info(f"New message from {sender_name} in {chat_name}: {message_text}")
-                
-            except Exception as e:
-                logger.error(f"❌ Error handling message: {e}")
+        self._register_event_handler()
                 
         logger.info(f"Monitoring started for {len(self.monitored_channels)} channels")
         
         # Keep monitoring running
         self.running = True
         
+        # Remember the current configuration so only later changes trigger a reload.
+        # The query takes the database lock, so it runs in a worker thread like other DB calls.
+        await asyncio.to_thread(self.db_client.get_monitored_channels_if_changed)
+        last_poll = time.monotonic()
         
         try:
             while self.running:
                 await asyncio.sleep(1)
+                if time.monotonic() - last_poll >= CHANNELS_POLL_INTERVAL:
+                    last_poll = time.monotonic()
+                    await self._reload_channels_if_changed()
         except asyncio.CancelledError:
             logger.info("Monitoring task cancelled")
         finally:
             pass
     
+    async def _reload_channels_if_changed(self) -> None:
+        """Pick up monitored channel changes written to the database by another process"""
+        channels = await asyncio.to_thread(self.db_client.get_monitored_channels_if_changed)
+        if channels is not None and frozenset(channels) != self.monitored_channels:
+            logger.info(f"Monitored channels changed in database, now monitoring {len(channels)} channels")
+            self.update_channels(channels)
+    
     def stop(self):
-        """Stop monitoring"""
+        """Stop monitoring, handing any buffered messages to a final batch"""
         self.running = False
+        self._flush_burst()
+    
+    async def wait_for_batches(self) -> None:
+        """Wait until the batches still being processed have been saved"""
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
         
     
-    def update_channels(self, channels: List[int]):
+    def update_channels(self, channels: Iterable[int]):
         """Update monitored channels"""
-        self.monitored_channels = channels
+        self.monitored_channels = frozenset(channels)
+        if self._handler_registered:
+            self._register_event_handler()
     
@@ -4,7 +4,7 @@ Textual CLI Task - Handles interactive menu-based interface using Textual librar
 """
 
 import asyncio
-from typing import TYPE_CHECKING, List, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
@@ -15,8 +15,6 @@ from textual.screen import Screen
 from textual.binding import Binding
 from textual.message import Message
 from textual import on
-from colorama import Fore
-import pyperclip
 from news_reader.logging_config import get_logger
 
 if TYPE_CHECKING:
@@ -119,9 +117,13 @@ class ChannelsScreen(Screen):
             table.add_row("", "", "No cached channels found. Press 'u' to fetch from Telegram API")
             return
         
-        for channel in self.app_instance.cached_channels:
-            monitored = "✅" if channel['id'] in self.app_instance.monitored_channels else ""
-            table.add_row(monitored, str(channel['id']), channel['title'], key=str(channel['id']))
+        # Add all rows under a single batched screen update instead of refreshing per row
+        monitored_channels = self.app_instance.monitored_channels
+        with self.app.batch_update():
+            for channel in self.app_instance.cached_channels:
+                channel_id = str(channel['id'])
+                monitored = "✅" if channel['id'] in monitored_channels else ""
+                table.add_row(monitored, channel_id, channel['title'], key=channel_id)
     
     async def action_update(self) -> None:
         """Update channels from Telegram API"""
@@ -147,11 +149,11 @@ class ChannelsScreen(Screen):
         asyncio.create_task(self.action_update())
     
     @on(Button.Pressed, "#copy_btn")
-    def copy_button_pressed(self) -> None:
+    async def copy_button_pressed(self) -> None:
         """Handle copy button press"""
-        self.action_copy()
+        await self.action_copy()
     
-    def action_copy(self) -> None:
+    async def action_copy(self) -> None:
         """Copy selected channel ID to clipboard"""
         table = self.query_one("#channels_table", DataTable)
         
@@ -166,19 +168,18 @@ class ChannelsScreen(Screen):
         
         try:
             # Get the channel ID from the selected row
-            row_key = table.get_row_at(table.cursor_row).key
-            if row_key:
-                channel_id = row_key
+            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+            if row_key and row_key.value:
+                channel_id = row_key.value
                 
                 # Find the channel to get its title
-                channel_title = "Unknown"
-                for channel in self.app_instance.cached_channels:
-                    if str(channel['id']) == channel_id:
-                        channel_title = channel['title']
-                        break
+                channel = self.app_instance.cached_channels_by_id.get(int(channel_id))
+                channel_title = channel['title'] if channel else "Unknown"
                 
-                # Copy to clipboard
-                pyperclip.copy(channel_id)
+                # Copy to clipboard. pyperclip probes for a clipboard backend on import and
+                # shells out to it on copy, so import it on first use and copy off the event loop
+                import pyperclip
+                await asyncio.to_thread(pyperclip.copy, channel_id)
                 self.notify(f"✅ Copied channel ID {channel_id} to clipboard!\n📋 Channel: {channel_title}")
             else:
                 self.notify("❌ Could not get channel ID from selection", severity="error")
@@ -225,8 +226,9 @@ class MonitoringScreen(Screen):
         
         if self.app_instance.monitored_channels:
             content_lines.append(f"✅ Monitoring {len(self.app_instance.monitored_channels)} channels:")
-            for channel_id in self.app_instance.monitored_channels:
-                channel_info = self.app_instance.db_client.get_channel_info(channel_id)
+            channel_infos = self.app_instance.db_client.get_channel_infos(self.app_instance.monitored_channels_list)
+            for channel_id in self.app_instance.monitored_channels_list:
+                channel_info = channel_infos.get(channel_id, {})
                 title = channel_info.get('channel_title', f'Channel {channel_id}')
                 content_lines.append(f"  - {title} ({channel_id})")
         else:
@@ -259,7 +261,7 @@ class MonitoringSetupScreen(Screen):
     def __init__(self, app_instance: 'NewsReaderApp'):
         super().__init__()
         self.app_instance = app_instance
-        self.checkboxes: List[Checkbox] = []
+        self.checkboxes: Dict[int, Checkbox] = {}  # Keyed by channel ID
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -290,7 +292,7 @@ class MonitoringSetupScreen(Screen):
             container.mount(Static("No cached channels found. Please update channels first."))
             return
         
-        self.checkboxes = []
+        self.checkboxes = {}
         for channel in self.app_instance.cached_channels:
             is_monitored = channel['id'] in self.app_instance.monitored_channels
             checkbox = Checkbox(
@@ -298,19 +300,14 @@ class MonitoringSetupScreen(Screen):
                 value=is_monitored,
                 id=f"channel_{channel['id']}"
             )
-            self.checkboxes.append(checkbox)
+            self.checkboxes[channel['id']] = checkbox
             container.mount(checkbox)
     
     @on(Button.Pressed, "#save_btn")
     async def save_configuration(self) -> None:
         """Save monitoring configuration"""
-        selected_channels = []
-        
-        for checkbox in self.checkboxes:
-            if checkbox.value:
-                # Extract channel ID from checkbox ID
-                channel_id = int(checkbox.id.replace("channel_", ""))
-                selected_channels.append(channel_id)
+        # Channel IDs are kept with their checkboxes, so nothing is parsed back from widget IDs
+        selected_channels = [channel_id for channel_id, checkbox in self.checkboxes.items() if checkbox.value]
         
         user_name = self.app_instance.session_data.get('user_name', 'system')
         if self.app_instance.db_client.set_monitored_channels(selected_channels, user=user_name):
@@ -327,13 +324,13 @@ class MonitoringSetupScreen(Screen):
     @on(Button.Pressed, "#select_all_btn")
     def select_all(self) -> None:
         """Select all channels"""
-        for checkbox in self.checkboxes:
+        for checkbox in self.checkboxes.values():
             checkbox.value = True
     
     @on(Button.Pressed, "#select_none_btn")
     def select_none(self) -> None:
         """Deselect all channels"""
-        for checkbox in self.checkboxes:
+        for checkbox in self.checkboxes.values():
             checkbox.value = False
     
     @on(Button.Pressed, "#cancel_btn")